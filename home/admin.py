@@ -2,11 +2,83 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from django.utils.functional import cached_property
 from .models import (
     ContactInquiry, NewsletterSubscription, ContactMethod, 
-    FAQ, Testimonial, Service, ContactLog
+    FAQ, Testimonial, Service, ContactLog, ServiceTag
 )
 from django.utils import timezone
+from django.db.models import F, ExpressionWrapper, DurationField
+from django.db.models.functions import Now
+from django.db import connections, transaction
+from django.core.paginator import EmptyPage, Paginator
+from django.contrib.admin.views.main import ChangeList
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that uses the planner's row estimate for large unfiltered tables on PostgreSQL
+    
+    The estimate only sizes the page links. reltuples is refreshed by ANALYZE, so
+    when a requested page falls outside the estimate the paginator switches to the
+    exact count instead of rejecting a page that exists or showing one that doesn't.
+    """
+    
+    estimate_threshold = 10000
+    is_estimate = False
+    
+    def _estimated_count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.estimate_threshold:
+                return int(row[0])
+        return None
+    
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None:
+            self.is_estimate = True
+            return estimate
+        return super().count
+    
+    def _use_exact_count(self):
+        self.is_estimate = False
+        self.__dict__['count'] = self.object_list.count()
+        self.__dict__.pop('num_pages', None)
+    
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.is_estimate:
+                raise
+        # A stale estimate can be too low; check against the real row count
+        self._use_exact_count()
+        return super().validate_number(number)
+    
+    def page(self, number):
+        page = super().page(number)
+        if self.is_estimate and page.number > 1 and not page.object_list:
+            # A stale estimate can be too high; past the real last page
+            self._use_exact_count()
+            return super().page(number)
+        return page
+
+class ContactLogChangeList(ChangeList):
+    """Changelist that skips the long text columns not shown in list_display"""
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer(
+            'description', 'outcome', 'next_action',
+            'inquiry__message', 'inquiry__notes', 'inquiry__user_agent'
+        )
 
 @admin.register(ContactInquiry)
 class ContactInquiryAdmin(admin.ModelAdmin):
@@ -19,12 +91,15 @@ class ContactInquiryAdmin(admin.ModelAdmin):
         'newsletter_subscription'
     ]
     search_fields = [
-        'first_name', 'last_name', 'email', 'practice_name', 
-        'location', 'message'
+        '^first_name', '^last_name', '=email', '^practice_name', 
+        '^location', 'message'
     ]
     readonly_fields = [
         'submitted_at', 'ip_address', 'user_agent', 'days_since_submission'
     ]
+    filter_horizontal = ('services_needed',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     fieldsets = (
         ('Personal Information', {
             'fields': ('first_name', 'last_name', 'email', 'phone')
@@ -47,38 +122,66 @@ class ContactInquiryAdmin(admin.ModelAdmin):
         }),
     )
     actions = ['mark_as_contacted', 'mark_as_qualified', 'assign_high_priority']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _days_since=ExpressionWrapper(
+                Now() - F('submitted_at'), output_field=DurationField()
+            )
+        )
+
+    def days_since_submission(self, obj):
+        return obj._days_since.days
+    days_since_submission.short_description = "Days Since Submission"
+    days_since_submission.admin_order_field = '_days_since'
     
     def mark_as_contacted(self, request, queryset):
-        queryset.update(status='contacted', last_contacted=timezone.now())
-        self.message_user(request, f"{queryset.count()} inquiries marked as contacted.")
+        with transaction.atomic():
+            inquiry_ids = list(queryset.values_list('id', flat=True))
+            updated = queryset.update(status='contacted', last_contacted=timezone.now())
+            ContactLog.objects.bulk_create([
+                ContactLog(
+                    inquiry_id=inquiry_id,
+                    action='follow_up',
+                    description='Marked as contacted via admin bulk action',
+                    performed_by=request.user.get_username()
+                )
+                for inquiry_id in inquiry_ids
+            ], batch_size=1000)
+        self.message_user(request, f"{updated} inquiries marked as contacted.")
     mark_as_contacted.short_description = "Mark selected inquiries as contacted"
     
     def mark_as_qualified(self, request, queryset):
-        queryset.update(status='qualified')
-        self.message_user(request, f"{queryset.count()} inquiries marked as qualified.")
+        updated = queryset.update(status='qualified')
+        self.message_user(request, f"{updated} inquiries marked as qualified.")
     mark_as_qualified.short_description = "Mark selected inquiries as qualified"
     
     def assign_high_priority(self, request, queryset):
-        queryset.update(priority='high')
-        self.message_user(request, f"{queryset.count()} inquiries assigned high priority.")
+        updated = queryset.update(priority='high')
+        self.message_user(request, f"{updated} inquiries assigned high priority.")
     assign_high_priority.short_description = "Assign high priority to selected inquiries"
 
+@admin.register(ServiceTag)
+class ServiceTagAdmin(admin.ModelAdmin):
+    list_display = ['slug', 'name']
+    search_fields = ['slug', 'name']
+
 @admin.register(NewsletterSubscription)
 class NewsletterSubscriptionAdmin(admin.ModelAdmin):
     list_display = ['email', 'full_name', 'source', 'subscribed_at', 'is_active']
     list_filter = ['is_active', 'source', 'subscribed_at']
-    search_fields = ['email', 'first_name', 'last_name']
+    search_fields = ['=email', 'first_name', 'last_name']
     readonly_fields = ['subscribed_at']
     actions = ['activate_subscriptions', 'deactivate_subscriptions']
     
     def activate_subscriptions(self, request, queryset):
-        queryset.update(is_active=True)
-        self.message_user(request, f"{queryset.count()} subscriptions activated.")
+        updated = queryset.update(is_active=True)
+        self.message_user(request, f"{updated} subscriptions activated.")
     activate_subscriptions.short_description = "Activate selected subscriptions"
     
     def deactivate_subscriptions(self, request, queryset):
-        queryset.update(is_active=False)
-        self.message_user(request, f"{queryset.count()} subscriptions deactivated.")
+        updated = queryset.update(is_active=False)
+        self.message_user(request, f"{updated} subscriptions deactivated.")
     deactivate_subscriptions.short_description = "Deactivate selected subscriptions"
 
 @admin.register(ContactMethod)
@@ -143,14 +246,23 @@ class ContactLogAdmin(admin.ModelAdmin):
     search_fields = ['inquiry__first_name', 'inquiry__last_name', 'description']
     readonly_fields = ['performed_at']
     date_hierarchy = 'performed_at'
-    
+    list_select_related = ('inquiry',)
+    autocomplete_fields = ['inquiry']
+
+    def get_changelist(self, request, **kwargs):
+        return ContactLogChangeList
+
+    @cached_property
+    def _inquiry_url_template(self):
+        return reverse('admin:home_contactinquiry_change', args=[0]).replace('/0/', '/{id}/')
+
     def inquiry_link(self, obj):
-        if obj.inquiry:
-            url = reverse('admin:home_contactinquiry_change', args=[obj.inquiry.id])
+        if obj.inquiry_id:
+            url = self._inquiry_url_template.format(id=obj.inquiry_id)
             return format_html('<a href="{}">{}</a>', url, obj.inquiry.full_name)
         return "N/A"
     inquiry_link.short_description = "Inquiry"
-    inquiry_link.admin_order_field = 'inquiry__first_name'
+    inquiry_link.admin_order_field = 'inquiry__full_name'
 
 # Customize admin site
 admin.site.site_header = "DoctorConnect Administration"
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.db.models import Q, Count
+
+from .models import (
+    ContactInquiry, NewsletterSubscription, ContactMethod,
+    FAQ, Testimonial, Service
+)
+
+# Cached page data that rarely changes; entries are cleared by the
+# post_save/post_delete receivers in signals.py
+CACHE_TIMEOUT = 60 * 10
+STATS_CACHE_TIMEOUT = 60 * 5
+HOME_STATIC_TIMEOUT = 60 * 5
+
+HOME_STATIC_KEY = 'home_static'
+ACTIVE_FAQS_KEY = 'active_faqs_v1'
+ACTIVE_CONTACT_METHODS_KEY = 'active_contact_methods_v1'
+HOME_STATS_KEY = 'home_stats'
+ABOUT_STATS_KEY = 'about_stats'
+
+def _home_static():
+    return {
+        'featured_testimonials': list(
+            Testimonial.objects.filter(is_active=True, is_featured=True)[:2]
+        ),
+        'services': list(Service.objects.filter(is_active=True).order_by('order')),
+    }
+
+def home_static():
+    """Featured testimonials and active services shown on the home page"""
+    return cache.get_or_set(HOME_STATIC_KEY, _home_static, HOME_STATIC_TIMEOUT)
+
+def active_faqs():
+    """Active FAQs grouped by category"""
+    return cache.get_or_set(
+        ACTIVE_FAQS_KEY,
+        lambda: list(FAQ.objects.filter(is_active=True).order_by('category', 'order')),
+        CACHE_TIMEOUT
+    )
+
+def active_contact_methods():
+    """Active contact methods in display order"""
+    return cache.get_or_set(
+        ACTIVE_CONTACT_METHODS_KEY,
+        lambda: list(ContactMethod.objects.filter(is_active=True).order_by('order')),
+        CACHE_TIMEOUT
+    )
+
+def _home_stats():
+    stats = ContactInquiry.objects.aggregate(
+        total_doctors=Count('id', filter=Q(status__in=['closed', 'negotiating'])),
+        total_inquiries=Count('id'),
+    )
+    stats['active_subscriptions'] = NewsletterSubscription.objects.filter(is_active=True).count()
+    return stats
+
+def home_stats():
+    """Inquiry and subscription counts shown on the home page"""
+    return cache.get_or_set(HOME_STATS_KEY, _home_stats, STATS_CACHE_TIMEOUT)
+
+def _about_stats():
+    stats = ContactInquiry.objects.aggregate(
+        doctors_served=Count('id', filter=Q(status__in=['closed', 'negotiating'])),
+        medical_specialties=Count('specialty', distinct=True),
+    )
+    stats['years_experience'] = 5
+    return stats
+
+def about_stats():
+    """Team statistics shown on the about page"""
+    return cache.get_or_set(ABOUT_STATS_KEY, _about_stats, STATS_CACHE_TIMEOUT)
@@ -1,39 +1,63 @@
+import phonenumbers
+from phonenumbers import NumberParseException, PhoneNumberFormat
+
 from django import forms
 from django.core.validators import RegexValidator
 from .models import (
     ContactInquiry, NewsletterSubscription, FAQ, Testimonial, 
-    ContactMethod, Service
+    ContactMethod, Service, SPECIALTY_CHOICES, BUDGET_CHOICES, TIMELINE_CHOICES
+)
+
+# Shared widget attrs; Widget copies attrs on init, so these are never mutated
+_FORM_CONTROL = {'class': 'form-control'}
+_FORM_CHECK_INPUT = {'class': 'form-check-input'}
+
+_SERVICES_CHOICES = (
+    ('website-design', 'Professional Website Design'),
+    ('seo-optimization', 'SEO Optimization'),
+    ('appointment-system', 'Appointment Booking System'),
+    ('digital-marketing', 'Digital Marketing'),
+    ('google-business', 'Google Business Profile'),
+    ('social-media', 'Social Media Management'),
 )
 
-class ContactInquiryForm(forms.ModelForm):
+_CONTACT_PREFERENCE_CHOICES = (
+    ('email', 'Email'),
+    ('phone', 'Phone Call'),
+    ('either', 'Either is fine'),
+)
+
+def _normalize_phone(phone):
+    """Validate a phone number and return it in E.164 form"""
+    try:
+        number = phonenumbers.parse(phone, 'US')
+    except NumberParseException:
+        raise forms.ValidationError("Please enter a valid phone number.")
+    if not phonenumbers.is_valid_number(number):
+        raise forms.ValidationError("Please enter a valid phone number.")
+    return phonenumbers.format_number(number, PhoneNumberFormat.E164)
+
+class PhoneCleanMixin:
+    """Normalizes an optional phone field to E.164"""
+    
+    def clean_phone(self):
+        phone = self.cleaned_data.get('phone')
+        if phone:
+            return _normalize_phone(phone)
+        return phone
+
+class ContactInquiryForm(PhoneCleanMixin, forms.ModelForm):
     """Form for contact inquiries from doctors"""
     
     # Custom fields for better UX
     services_checkboxes = forms.MultipleChoiceField(
-        choices=[
-            ('website-design', 'Professional Website Design'),
-            ('seo-optimization', 'SEO Optimization'),
-            ('appointment-system', 'Appointment Booking System'),
-            ('digital-marketing', 'Digital Marketing'),
-            ('google-business', 'Google Business Profile'),
-            ('social-media', 'Social Media Management'),
-        ],
+        choices=_SERVICES_CHOICES,
         widget=forms.CheckboxSelectMultiple,
         required=False,
         label="Services You're Interested In"
     )
     
     # Custom validation
-    def clean_phone(self):
-        phone = self.cleaned_data.get('phone')
-        if phone:
-            # Remove all non-digit characters except +
-            cleaned_phone = ''.join(c for c in phone if c.isdigit() or c == '+')
-            if len(cleaned_phone) < 10:
-                raise forms.ValidationError("Please enter a valid phone number with at least 10 digits.")
-            return cleaned_phone
-        return phone
-    
     def clean_services_needed(self):
         services = self.cleaned_data.get('services_checkboxes', [])
         if not services:
@@ -49,61 +73,59 @@ class ContactInquiryForm(forms.ModelForm):
         ]
         widgets = {
             'first_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your first name',
                 'autocomplete': 'given-name'
             }),
             'last_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your last name',
                 'autocomplete': 'family-name'
             }),
             'email': forms.EmailInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your email address',
                 'autocomplete': 'email'
             }),
             'phone': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your phone number (optional)',
                 'autocomplete': 'tel'
             }),
             'practice_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your practice name',
                 'autocomplete': 'organization'
             }),
             'specialty': forms.Select(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Select your medical specialty'
             }),
             'location': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'City, State (e.g., New York, NY)',
                 'autocomplete': 'address-level2'
             }),
             'current_website': forms.URLInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'https://example.com (optional)',
                 'autocomplete': 'url'
             }),
             'budget_range': forms.Select(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Select your budget range'
             }),
             'timeline': forms.Select(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Select your timeline'
             }),
             'message': forms.Textarea(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'rows': 5,
                 'placeholder': 'Tell us about your practice, current challenges, and what you hope to achieve online...',
                 'style': 'resize: vertical;'
             }),
-            'newsletter_subscription': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            })
+            'newsletter_subscription': forms.CheckboxInput(attrs=_FORM_CHECK_INPUT)
         }
         labels = {
             'first_name': 'First Name *',
@@ -127,25 +149,64 @@ class ContactInquiryForm(forms.ModelForm):
             'message': 'The more details you provide, the better we can serve you.'
         }
 
+class ContactInquiryAPIForm(PhoneCleanMixin, forms.Form):
+    """Lightweight validation for contact form submissions to the API"""
+    
+    first_name = forms.CharField(max_length=100)
+    last_name = forms.CharField(max_length=100)
+    email = forms.EmailField(max_length=254)
+    phone = forms.CharField(max_length=20, required=False)
+    practice_name = forms.CharField(max_length=200)
+    specialty = forms.ChoiceField(choices=SPECIALTY_CHOICES)
+    location = forms.CharField(max_length=200)
+    current_website = forms.URLField(max_length=200, required=False)
+    budget_range = forms.ChoiceField(choices=(('', ''),) + BUDGET_CHOICES, required=False)
+    timeline = forms.ChoiceField(choices=(('', ''),) + TIMELINE_CHOICES, required=False)
+    message = forms.CharField()
+    newsletter_subscription = forms.BooleanField(required=False)
+    services_checkboxes = forms.MultipleChoiceField(choices=_SERVICES_CHOICES, required=False)
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        # Apply the model field validators a ModelForm would run in _post_clean,
+        # since save_contact_inquiry saves the instance without full_clean
+        data = {
+            name: value for name, value in cleaned_data.items()
+            if name != 'services_checkboxes'
+        }
+        try:
+            ContactInquiry(**data).clean_fields(exclude=[
+                field.name for field in ContactInquiry._meta.fields
+                if field.name not in data
+            ])
+        except forms.ValidationError as e:
+            self.add_error(None, e)
+        return cleaned_data
+
 class NewsletterSubscriptionForm(forms.ModelForm):
     """Form for newsletter subscriptions"""
     
+    def validate_unique(self):
+        # Existing emails are handled by subscribe_newsletter, which reactivates
+        # inactive subscriptions and reports active ones as already subscribed
+        pass
+    
     class Meta:
         model = NewsletterSubscription
         fields = ['email', 'first_name', 'last_name']
         widgets = {
             'email': forms.EmailInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter your email address',
                 'autocomplete': 'email'
             }),
             'first_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'First name (optional)',
                 'autocomplete': 'given-name'
             }),
             'last_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Last name (optional)',
                 'autocomplete': 'family-name'
             })
@@ -156,13 +217,13 @@ class NewsletterSubscriptionForm(forms.ModelForm):
             'last_name': 'Last Name'
         }
 
-class QuickContactForm(forms.Form):
+class QuickContactForm(PhoneCleanMixin, forms.Form):
     """Simple form for quick contact requests"""
     
     name = forms.CharField(
         max_length=200,
         widget=forms.TextInput(attrs={
-            'class': 'form-control',
+            **_FORM_CONTROL,
             'placeholder': 'Your name',
             'autocomplete': 'name'
         }),
@@ -171,7 +232,7 @@ class QuickContactForm(forms.Form):
     
     email = forms.EmailField(
         widget=forms.EmailInput(attrs={
-            'class': 'form-control',
+            **_FORM_CONTROL,
             'placeholder': 'Your email address',
             'autocomplete': 'email'
         }),
@@ -182,7 +243,7 @@ class QuickContactForm(forms.Form):
         max_length=20,
         required=False,
         widget=forms.TextInput(attrs={
-            'class': 'form-control',
+            **_FORM_CONTROL,
             'placeholder': 'Your phone number (optional)',
             'autocomplete': 'tel'
         }),
@@ -191,7 +252,7 @@ class QuickContactForm(forms.Form):
     
     message = forms.CharField(
         widget=forms.Textarea(attrs={
-            'class': 'form-control',
+            **_FORM_CONTROL,
             'rows': 4,
             'placeholder': 'How can we help you?',
             'style': 'resize: vertical;'
@@ -200,27 +261,11 @@ class QuickContactForm(forms.Form):
     )
     
     contact_preference = forms.ChoiceField(
-        choices=[
-            ('email', 'Email'),
-            ('phone', 'Phone Call'),
-            ('either', 'Either is fine')
-        ],
-        widget=forms.RadioSelect(attrs={
-            'class': 'form-check-input'
-        }),
+        choices=_CONTACT_PREFERENCE_CHOICES,
+        widget=forms.RadioSelect(attrs=_FORM_CHECK_INPUT),
         label='Preferred Contact Method *',
         initial='email'
     )
-    
-    def clean_phone(self):
-        phone = self.cleaned_data.get('phone')
-        if phone:
-            # Remove all non-digit characters except +
-            cleaned_phone = ''.join(c for c in phone if c.isdigit() or c == '+')
-            if len(cleaned_phone) < 10:
-                raise forms.ValidationError("Please enter a valid phone number with at least 10 digits.")
-            return cleaned_phone
-        return phone
 
 class ContactMethodForm(forms.ModelForm):
     """Form for managing contact methods"""
@@ -229,14 +274,14 @@ class ContactMethodForm(forms.ModelForm):
         model = ContactInquiry
         fields = ['status', 'priority', 'assigned_to', 'notes']
         widgets = {
-            'status': forms.Select(attrs={'class': 'form-control'}),
-            'priority': forms.Select(attrs={'class': 'form-control'}),
+            'status': forms.Select(attrs=_FORM_CONTROL),
+            'priority': forms.Select(attrs=_FORM_CONTROL),
             'assigned_to': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter team member name'
             }),
             'notes': forms.Textarea(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'rows': 4,
                 'placeholder': 'Add internal notes about this inquiry...'
             })
@@ -256,20 +301,20 @@ class FAQForm(forms.ModelForm):
         fields = ['question', 'answer', 'category', 'order', 'is_active']
         widgets = {
             'question': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter the question'
             }),
             'answer': forms.Textarea(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'rows': 4,
                 'placeholder': 'Enter the answer'
             }),
-            'category': forms.Select(attrs={'class': 'form-control'}),
+            'category': forms.Select(attrs=_FORM_CONTROL),
             'order': forms.NumberInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'min': 0
             }),
-            'is_active': forms.CheckboxInput(attrs={'class': 'form-check-input'})
+            'is_active': forms.CheckboxInput(attrs=_FORM_CHECK_INPUT)
         }
 
 class TestimonialForm(forms.ModelForm):
@@ -283,27 +328,27 @@ class TestimonialForm(forms.ModelForm):
         ]
         widgets = {
             'doctor_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter doctor\'s name'
             }),
             'practice_name': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter practice name'
             }),
             'specialty': forms.TextInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'placeholder': 'Enter medical specialty'
                 }),
             'testimonial_text': forms.Textarea(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'rows': 4,
                 'placeholder': 'Enter the testimonial text'
             }),
-            'rating': forms.Select(attrs={'class': 'form-control'}),
+            'rating': forms.Select(attrs=_FORM_CONTROL),
             'doctor_image': forms.FileInput(attrs={
-                'class': 'form-control',
+                **_FORM_CONTROL,
                 'accept': 'image/*'
             }),
-            'is_featured': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
-            'is_active': forms.CheckboxInput(attrs={'class': 'form-check-input'})
+            'is_featured': forms.CheckboxInput(attrs=_FORM_CHECK_INPUT),
+            'is_active': forms.CheckboxInput(attrs=_FORM_CHECK_INPUT)
         }
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(condition=models.Q(('status__in', ['new', 'contacted', 'qualified'])), fields=['status', 'priority', '-submitted_at'], name='ci_active_idx'),
+        ),
+    ]
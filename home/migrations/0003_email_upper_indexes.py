@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:47
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0002_contactinquiry_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='ci_email_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newslettersubscription',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='ns_email_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+from django.db import migrations, models
+
+
+SERVICE_TAGS = [
+    ('website-design', 'Professional Website Design'),
+    ('seo-optimization', 'SEO Optimization'),
+    ('appointment-system', 'Appointment Booking System'),
+    ('digital-marketing', 'Digital Marketing'),
+    ('google-business', 'Google Business Profile'),
+    ('social-media', 'Social Media Management'),
+]
+
+
+def copy_services_to_tags(apps, schema_editor):
+    ServiceTag = apps.get_model('home', 'ServiceTag')
+    ContactInquiry = apps.get_model('home', 'ContactInquiry')
+
+    tags = {
+        slug: ServiceTag.objects.create(slug=slug, name=name)
+        for slug, name in SERVICE_TAGS
+    }
+    for inquiry in ContactInquiry.objects.only('id', 'services_needed').iterator():
+        slugs = inquiry.services_needed or []
+        for slug in slugs:
+            if slug not in tags:
+                tags[slug] = ServiceTag.objects.create(slug=slug)
+        inquiry.service_tags.set([tags[slug] for slug in slugs])
+
+
+def copy_tags_to_services(apps, schema_editor):
+    ContactInquiry = apps.get_model('home', 'ContactInquiry')
+
+    for inquiry in ContactInquiry.objects.prefetch_related('service_tags').iterator(chunk_size=500):
+        inquiry.services_needed = [tag.slug for tag in inquiry.service_tags.all()]
+        inquiry.save(update_fields=['services_needed'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0003_email_upper_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=100, unique=True, verbose_name='Slug')),
+                ('name', models.CharField(blank=True, max_length=200, verbose_name='Service Name')),
+            ],
+            options={
+                'verbose_name': 'Service Tag',
+                'verbose_name_plural': 'Service Tags',
+                'ordering': ['slug'],
+            },
+        ),
+        migrations.AddField(
+            model_name='contactinquiry',
+            name='service_tags',
+            field=models.ManyToManyField(blank=True, related_name='inquiries', to='home.servicetag'),
+        ),
+        migrations.RunPython(copy_services_to_tags, copy_tags_to_services),
+        migrations.RemoveField(
+            model_name='contactinquiry',
+            name='services_needed',
+        ),
+        migrations.RenameField(
+            model_name='contactinquiry',
+            old_name='service_tags',
+            new_name='services_needed',
+        ),
+        migrations.AlterField(
+            model_name='contactinquiry',
+            name='services_needed',
+            field=models.ManyToManyField(blank=True, help_text='List of services the doctor is interested in', related_name='inquiries', to='home.servicetag', verbose_name='Services Interested In'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0004_servicetag_services_needed_m2m'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contactinquiry',
+            name='submitted_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Submission Date'),
+        ),
+        migrations.AlterField(
+            model_name='contactlog',
+            name='performed_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Performed At'),
+        ),
+        migrations.AlterField(
+            model_name='faq',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Created Date'),
+        ),
+        migrations.AlterField(
+            model_name='newslettersubscription',
+            name='subscribed_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Subscription Date'),
+        ),
+        migrations.AlterField(
+            model_name='testimonial',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Created Date'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0005_auto_now_add_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(fields=['-submitted_at'], name='ci_submitted_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactlog',
+            index=models.Index(fields=['-performed_at'], name='cl_performed_at_idx'),
+        ),
+    ]
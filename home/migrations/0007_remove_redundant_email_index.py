@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0006_timestamp_range_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contactinquiry',
+            name='home_contac_email_5df6b8_idx',
+        ),
+    ]
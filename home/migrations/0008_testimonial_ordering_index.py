@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0007_remove_redundant_email_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['-is_featured', '-created_at'], name='test_featured_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0008_testimonial_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='contactmethod',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('type',), name='uniq_primary_per_type', violation_error_message='Only one primary contact method is allowed per type.'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0010_contactinquiry_full_name_generated'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['category', 'order', 'question'], name='faq_cat_order_q_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['order', 'name'], name='service_order_name_idx'),
+        ),
+    ]
@@ -1,13 +1,121 @@
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Concat, Upper
 from django.core.validators import RegexValidator
 from django.utils import timezone
 
+SPECIALTY_CHOICES = (
+    ('family-medicine', 'Family Medicine'),
+    ('cardiology', 'Cardiology'),
+    ('dermatology', 'Dermatology'),
+    ('orthopedics', 'Orthopedics'),
+    ('pediatrics', 'Pediatrics'),
+    ('dental', 'Dental'),
+    ('ophthalmology', 'Ophthalmology'),
+    ('neurology', 'Neurology'),
+    ('psychiatry', 'Psychiatry'),
+    ('surgery', 'Surgery'),
+    ('other', 'Other'),
+)
+
+BUDGET_CHOICES = (
+    ('under-500', 'Under $500'),
+    ('500-1000', '$500 - $1,000'),
+    ('1000-2000', '$1,000 - $2,000'),
+    ('2000-5000', '$2,000 - $5,000'),
+    ('over-5000', 'Over $5,000'),
+)
+
+TIMELINE_CHOICES = (
+    ('immediately', 'Immediately'),
+    ('1-month', 'Within 1 month'),
+    ('3-months', 'Within 3 months'),
+    ('6-months', 'Within 6 months'),
+    ('planning', 'Just planning/exploring'),
+)
+
+STATUS_CHOICES = (
+    ('new', 'New'),
+    ('contacted', 'Contacted'),
+    ('qualified', 'Qualified'),
+    ('proposal', 'Proposal Sent'),
+    ('negotiating', 'Negotiating'),
+    ('closed', 'Closed'),
+    ('lost', 'Lost'),
+)
+
+PRIORITY_CHOICES = (
+    ('low', 'Low'),
+    ('medium', 'Medium'),
+    ('high', 'High'),
+    ('urgent', 'Urgent'),
+)
+
+SOURCE_CHOICES = (
+    ('contact-form', 'Contact Form'),
+    ('website', 'Website Signup'),
+    ('manual', 'Manual Entry'),
+)
+
+CONTACT_TYPE_CHOICES = (
+    ('phone', 'Phone'),
+    ('email', 'Email'),
+    ('address', 'Address'),
+    ('social', 'Social Media'),
+    ('other', 'Other'),
+)
+
+CATEGORY_CHOICES = (
+    ('general', 'General'),
+    ('pricing', 'Pricing'),
+    ('services', 'Services'),
+    ('technical', 'Technical'),
+    ('support', 'Support'),
+)
+
+RATING_CHOICES = tuple((i, i) for i in range(1, 6))
+
+PRICE_PERIOD_CHOICES = (
+    ('one-time', 'One Time'),
+    ('monthly', 'Monthly'),
+    ('yearly', 'Yearly'),
+)
+
+ACTION_CHOICES = (
+    ('email_sent', 'Email Sent'),
+    ('phone_call', 'Phone Call'),
+    ('meeting_scheduled', 'Meeting Scheduled'),
+    ('proposal_sent', 'Proposal Sent'),
+    ('follow_up', 'Follow Up'),
+    ('other', 'Other'),
+)
+
+class ServiceTag(models.Model):
+    """Model for services a doctor can express interest in"""
+    
+    slug = models.SlugField(max_length=100, unique=True, verbose_name="Slug")
+    name = models.CharField(max_length=200, blank=True, verbose_name="Service Name")
+    
+    class Meta:
+        verbose_name = "Service Tag"
+        verbose_name_plural = "Service Tags"
+        ordering = ['slug']
+    
+    def __str__(self):
+        return self.name or self.slug
+
 class ContactInquiry(models.Model):
     """Model for storing contact form submissions"""
     
     # Personal Information
     first_name = models.CharField(max_length=100, verbose_name="First Name")
     last_name = models.CharField(max_length=100, verbose_name="Last Name")
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', models.Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+        verbose_name="Full Name"
+    )
     email = models.EmailField(verbose_name="Email Address")
     phone = models.CharField(
         max_length=20, 
@@ -25,27 +133,17 @@ class ContactInquiry(models.Model):
     practice_name = models.CharField(max_length=200, verbose_name="Practice Name")
     specialty = models.CharField(
         max_length=100,
-        choices=[
-            ('family-medicine', 'Family Medicine'),
-            ('cardiology', 'Cardiology'),
-            ('dermatology', 'Dermatology'),
-            ('orthopedics', 'Orthopedics'),
-            ('pediatrics', 'Pediatrics'),
-            ('dental', 'Dental'),
-            ('ophthalmology', 'Ophthalmology'),
-            ('neurology', 'Neurology'),
-            ('psychiatry', 'Psychiatry'),
-            ('surgery', 'Surgery'),
-            ('other', 'Other'),
-        ],
+        choices=SPECIALTY_CHOICES,
         verbose_name="Medical Specialty"
     )
     location = models.CharField(max_length=200, verbose_name="Practice Location")
     current_website = models.URLField(blank=True, verbose_name="Current Website")
     
     # Services Needed
-    services_needed = models.JSONField(
-        default=list,
+    services_needed = models.ManyToManyField(
+        ServiceTag,
+        blank=True,
+        related_name='inquiries',
         verbose_name="Services Interested In",
         help_text="List of services the doctor is interested in"
     )
@@ -53,26 +151,14 @@ class ContactInquiry(models.Model):
     # Project Details
     budget_range = models.CharField(
         max_length=50,
-        choices=[
-            ('under-500', 'Under $500'),
-            ('500-1000', '$500 - $1,000'),
-            ('1000-2000', '$1,000 - $2,000'),
-            ('2000-5000', '$2,000 - $5,000'),
-            ('over-5000', 'Over $5,000'),
-        ],
+        choices=BUDGET_CHOICES,
         blank=True,
         verbose_name="Monthly Budget Range"
     )
     
     timeline = models.CharField(
         max_length=50,
-        choices=[
-            ('immediately', 'Immediately'),
-            ('1-month', 'Within 1 month'),
-            ('3-months', 'Within 3 months'),
-            ('6-months', 'Within 6 months'),
-            ('planning', 'Just planning/exploring'),
-        ],
+        choices=TIMELINE_CHOICES,
         blank=True,
         verbose_name="Project Timeline"
     )
@@ -85,34 +171,21 @@ class ContactInquiry(models.Model):
     )
     
     # Metadata
-    submitted_at = models.DateTimeField(default=timezone.now, verbose_name="Submission Date")
+    submitted_at = models.DateTimeField(auto_now_add=True, verbose_name="Submission Date")
     ip_address = models.GenericIPAddressField(blank=True, null=True, verbose_name="IP Address")
     user_agent = models.TextField(blank=True, verbose_name="User Agent")
     
     # Status and Follow-up
     status = models.CharField(
         max_length=50,
-        choices=[
-            ('new', 'New'),
-            ('contacted', 'Contacted'),
-            ('qualified', 'Qualified'),
-            ('proposal', 'Proposal Sent'),
-            ('negotiating', 'Negotiating'),
-            ('closed', 'Closed'),
-            ('lost', 'Lost'),
-        ],
+        choices=STATUS_CHOICES,
         default='new',
         verbose_name="Status"
     )
     
     priority = models.CharField(
         max_length=50,
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('urgent', 'Urgent'),
-        ],
+        choices=PRIORITY_CHOICES,
         default='medium',
         verbose_name="Priority"
     )
@@ -133,16 +206,19 @@ class ContactInquiry(models.Model):
         indexes = [
             models.Index(fields=['status', 'submitted_at']),
             models.Index(fields=['specialty', 'submitted_at']),
-            models.Index(fields=['email']),
+            models.Index(
+                fields=['status', 'priority', '-submitted_at'],
+                name='ci_active_idx',
+                condition=Q(status__in=['new', 'contacted', 'qualified'])
+            ),
+            models.Index(Upper('email'), name='ci_email_upper_idx'),
+            models.Index(fields=['-submitted_at'], name='ci_submitted_at_idx'),
+            models.Index(fields=['full_name'], name='ci_full_name_idx'),
         ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.practice_name}"
     
-    @property
-    def full_name(self):
-        return f"{self.first_name} {self.last_name}"
-    
     @property
     def days_since_submission(self):
         return (timezone.now() - self.submitted_at).days
@@ -153,15 +229,11 @@ class NewsletterSubscription(models.Model):
     email = models.EmailField(unique=True, verbose_name="Email Address")
     first_name = models.CharField(max_length=100, blank=True, verbose_name="First Name")
     last_name = models.CharField(max_length=100, blank=True, verbose_name="Last Name")
-    subscribed_at = models.DateTimeField(default=timezone.now, verbose_name="Subscription Date")
+    subscribed_at = models.DateTimeField(auto_now_add=True, verbose_name="Subscription Date")
     is_active = models.BooleanField(default=True, verbose_name="Active Subscription")
     source = models.CharField(
         max_length=100,
-        choices=[
-            ('contact-form', 'Contact Form'),
-            ('website', 'Website Signup'),
-            ('manual', 'Manual Entry'),
-        ],
+        choices=SOURCE_CHOICES,
         default='website',
         verbose_name="Subscription Source"
     )
@@ -170,6 +242,9 @@ class NewsletterSubscription(models.Model):
         verbose_name = "Newsletter Subscription"
         verbose_name_plural = "Newsletter Subscriptions"
         ordering = ['-subscribed_at']
+        indexes = [
+            models.Index(Upper('email'), name='ns_email_upper_idx'),
+        ]
     
     def __str__(self):
         return self.email
@@ -191,13 +266,7 @@ class ContactMethod(models.Model):
     name = models.CharField(max_length=100, verbose_name="Contact Method Name")
     type = models.CharField(
         max_length=50,
-        choices=[
-            ('phone', 'Phone'),
-            ('email', 'Email'),
-            ('address', 'Address'),
-            ('social', 'Social Media'),
-            ('other', 'Other'),
-        ],
+        choices=CONTACT_TYPE_CHOICES,
         verbose_name="Contact Type"
     )
     
@@ -211,6 +280,14 @@ class ContactMethod(models.Model):
         verbose_name = "Contact Method"
         verbose_name_plural = "Contact Methods"
         ordering = ['order', 'name']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['type'],
+                condition=Q(is_primary=True),
+                name='uniq_primary_per_type',
+                violation_error_message="Only one primary contact method is allowed per type."
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.value}"
@@ -222,25 +299,22 @@ class FAQ(models.Model):
     answer = models.TextField(verbose_name="Answer")
     category = models.CharField(
         max_length=100,
-        choices=[
-            ('general', 'General'),
-            ('pricing', 'Pricing'),
-            ('services', 'Services'),
-            ('technical', 'Technical'),
-            ('support', 'Support'),
-        ],
+        choices=CATEGORY_CHOICES,
         default='general',
         verbose_name="Category"
     )
     order = models.PositiveIntegerField(default=0, verbose_name="Display Order")
     is_active = models.BooleanField(default=True, verbose_name="Active")
-    created_at = models.DateTimeField(default=timezone.now, verbose_name="Created Date")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created Date")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Last Updated")
     
     class Meta:
         verbose_name = "FAQ"
         verbose_name_plural = "FAQs"
         ordering = ['category', 'order', 'question']
+        indexes = [
+            models.Index(fields=['category', 'order', 'question'], name='faq_cat_order_q_idx'),
+        ]
     
     def __str__(self):
         return self.question
@@ -253,7 +327,7 @@ class Testimonial(models.Model):
     specialty = models.CharField(max_length=100, verbose_name="Medical Specialty")
     testimonial_text = models.TextField(verbose_name="Testimonial")
     rating = models.PositiveIntegerField(
-        choices=[(i, i) for i in range(1, 6)],
+        choices=RATING_CHOICES,
         verbose_name="Rating"
     )
     doctor_image = models.ImageField(
@@ -264,12 +338,15 @@ class Testimonial(models.Model):
     )
     is_featured = models.BooleanField(default=False, verbose_name="Featured Testimonial")
     is_active = models.BooleanField(default=True, verbose_name="Active")
-    created_at = models.DateTimeField(default=timezone.now, verbose_name="Created Date")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created Date")
     
     class Meta:
         verbose_name = "Testimonial"
         verbose_name_plural = "Testimonials"
         ordering = ['-is_featured', '-created_at']
+        indexes = [
+            models.Index(fields=['-is_featured', '-created_at'], name='test_featured_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.doctor_name} - {self.practice_name}"
@@ -290,11 +367,7 @@ class Service(models.Model):
     )
     price_period = models.CharField(
         max_length=50,
-        choices=[
-            ('one-time', 'One Time'),
-            ('monthly', 'Monthly'),
-            ('yearly', 'Yearly'),
-        ],
+        choices=PRICE_PERIOD_CHOICES,
         verbose_name="Price Period"
     )
     
@@ -315,6 +388,9 @@ class Service(models.Model):
         verbose_name = "Service"
         verbose_name_plural = "Services"
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=['order', 'name'], name='service_order_name_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -331,14 +407,7 @@ class ContactLog(models.Model):
     
     action = models.CharField(
         max_length=100,
-        choices=[
-            ('email_sent', 'Email Sent'),
-            ('phone_call', 'Phone Call'),
-            ('meeting_scheduled', 'Meeting Scheduled'),
-            ('proposal_sent', 'Proposal Sent'),
-            ('follow_up', 'Follow Up'),
-            ('other', 'Other'),
-        ],
+        choices=ACTION_CHOICES,
         verbose_name="Action Taken"
     )
     
@@ -348,12 +417,15 @@ class ContactLog(models.Model):
     scheduled_date = models.DateTimeField(blank=True, null=True, verbose_name="Scheduled Date")
     
     performed_by = models.CharField(max_length=100, verbose_name="Performed By")
-    performed_at = models.DateTimeField(default=timezone.now, verbose_name="Performed At")
+    performed_at = models.DateTimeField(auto_now_add=True, verbose_name="Performed At")
     
     class Meta:
         verbose_name = "Contact Log"
         verbose_name_plural = "Contact Logs"
         ordering = ['-performed_at']
+        indexes = [
+            models.Index(fields=['-performed_at'], name='cl_performed_at_idx'),
+        ]
     
     def __str__(self):
         return f"{self.inquiry.full_name} - {self.action} on {self.performed_at.strftime('%Y-%m-%d')}"
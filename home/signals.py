@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .caching import (
+    HOME_STATIC_KEY, ACTIVE_FAQS_KEY,
+    ACTIVE_CONTACT_METHODS_KEY, HOME_STATS_KEY, ABOUT_STATS_KEY
+)
+from .models import (
+    ContactInquiry, NewsletterSubscription, ContactMethod,
+    FAQ, Testimonial, Service
+)
+
+@receiver([post_save, post_delete], sender=Testimonial)
+@receiver([post_save, post_delete], sender=Service)
+def clear_home_static_cache(sender, **kwargs):
+    cache.delete(HOME_STATIC_KEY)
+
+@receiver([post_save, post_delete], sender=FAQ)
+def clear_faq_cache(sender, **kwargs):
+    cache.delete(ACTIVE_FAQS_KEY)
+
+@receiver([post_save, post_delete], sender=ContactMethod)
+def clear_contact_method_cache(sender, **kwargs):
+    cache.delete(ACTIVE_CONTACT_METHODS_KEY)
+
+@receiver([post_save, post_delete], sender=ContactInquiry)
+def clear_inquiry_stats_cache(sender, **kwargs):
+    cache.delete_many([HOME_STATS_KEY, ABOUT_STATS_KEY])
+
+@receiver([post_save, post_delete], sender=NewsletterSubscription)
+def clear_subscription_stats_cache(sender, **kwargs):
+    cache.delete(HOME_STATS_KEY)
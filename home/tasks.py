@@ -0,0 +1,21 @@
+import logging
+import threading
+
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+def _run(func, args):
+    try:
+        func(*args)
+    except Exception as e:
+        logger.error(f"Error running background task {func.__name__}: {str(e)}")
+    finally:
+        # Each thread gets its own DB connections; don't leave them open
+        connections.close_all()
+
+def run_in_background(func, *args):
+    """Run func(*args) in a daemon thread once the current transaction commits"""
+    transaction.on_commit(
+        lambda: threading.Thread(target=_run, args=(func, args), daemon=True).start()
+    )
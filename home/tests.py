@@ -1,3 +1,163 @@
+from unittest import mock
+
+from django.core.paginator import EmptyPage
 from django.test import TestCase
+from django.urls import reverse
+
+from .admin import EstimatedCountPaginator
+from .models import ContactInquiry, NewsletterSubscription
+from .views import send_newsletter_welcome_email
+
+
+@mock.patch('home.views.run_in_background')
+class NewsletterSubscriptionTests(TestCase):
+    """Tests for the newsletter subscription endpoint"""
+    
+    def subscribe(self, **data):
+        return self.client.post(
+            reverse('newsletter_api'), data, HTTP_HOST='mediwellcare.com'
+        )
+    
+    def test_new_subscription(self, run_in_background):
+        response = self.subscribe(email='new@example.com', first_name='Ann', last_name='Lee')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        subscription = NewsletterSubscription.objects.get(email='new@example.com')
+        self.assertTrue(subscription.is_active)
+        self.assertEqual(subscription.source, 'website')
+        self.assertEqual(subscription.first_name, 'Ann')
+        run_in_background.assert_called_once_with(send_newsletter_welcome_email, subscription)
+        self.assertEqual(run_in_background.call_args.args[1].pk, subscription.pk)
+    
+    def test_reactivated_subscription(self, run_in_background):
+        subscription = NewsletterSubscription.objects.create(
+            email='old@example.com', first_name='Old', last_name='Name',
+            source='contact-form', is_active=False
+        )
+        
+        response = self.subscribe(email='old@example.com', first_name='Ann', last_name='Lee')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        subscription.refresh_from_db()
+        self.assertTrue(subscription.is_active)
+        self.assertEqual(subscription.first_name, 'Ann')
+        self.assertEqual(subscription.last_name, 'Lee')
+        self.assertEqual(subscription.source, 'contact-form')
+        self.assertEqual(NewsletterSubscription.objects.count(), 1)
+        run_in_background.assert_called_once()
+        emailed = run_in_background.call_args.args[1]
+        self.assertEqual(emailed.pk, subscription.pk)
+        self.assertEqual(emailed.first_name, 'Ann')
+    
+    def test_already_active_subscription(self, run_in_background):
+        NewsletterSubscription.objects.create(
+            email='active@example.com', first_name='Ann', is_active=True
+        )
+        
+        response = self.subscribe(email='active@example.com', first_name='Someone')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()['message'], 'You are already subscribed to our newsletter.'
+        )
+        subscription = NewsletterSubscription.objects.get(email='active@example.com')
+        self.assertEqual(subscription.first_name, 'Ann')
+        self.assertEqual(NewsletterSubscription.objects.count(), 1)
+        run_in_background.assert_not_called()
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """Tests for the admin paginator when the row estimate is stale"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        NewsletterSubscription.objects.bulk_create([
+            NewsletterSubscription(email=f'reader{i}@example.com') for i in range(30)
+        ])
+    
+    def paginator(self, estimate):
+        paginator = EstimatedCountPaginator(
+            NewsletterSubscription.objects.order_by('id'), 10
+        )
+        paginator._estimated_count = lambda: estimate
+        return paginator
+    
+    def test_estimate_is_used_for_reachable_pages(self):
+        paginator = self.paginator(estimate=25)
+        
+        self.assertEqual(len(paginator.page(2).object_list), 10)
+        self.assertTrue(paginator.is_estimate)
+        self.assertEqual(paginator.count, 25)
+    
+    def test_low_estimate_does_not_hide_pages(self):
+        paginator = self.paginator(estimate=10)
+        
+        page = paginator.page(3)
+        
+        self.assertEqual(len(page.object_list), 10)
+        self.assertEqual(paginator.count, 30)
+        self.assertEqual(paginator.num_pages, 3)
+    
+    def test_high_estimate_does_not_show_missing_pages(self):
+        paginator = self.paginator(estimate=100)
+        
+        with self.assertRaises(EmptyPage):
+            paginator.page(5)
+        self.assertEqual(paginator.count, 30)
+        self.assertEqual(paginator.num_pages, 3)
+
 
-# Create your tests here.
+@mock.patch('home.views.run_in_background')
+class PhoneNumberTests(TestCase):
+    """Tests for phone validation on the contact endpoints"""
+    
+    def submit_contact(self, phone):
+        return self.client.post(reverse('contact_api'), {
+            'first_name': 'Ann',
+            'last_name': 'Lee',
+            'email': 'ann@example.com',
+            'phone': phone,
+            'practice_name': 'Lee Family Dental',
+            'specialty': 'dental',
+            'location': 'New York, NY',
+            'message': 'We need a new website.',
+        }, HTTP_HOST='mediwellcare.com')
+    
+    def submit_quick_contact(self, phone):
+        return self.client.post(reverse('quick_contact_api'), {
+            'name': 'Ann Lee',
+            'email': 'ann@example.com',
+            'phone': phone,
+            'message': 'Please call me.',
+            'contact_preference': 'phone',
+        }, HTTP_HOST='mediwellcare.com')
+    
+    def test_local_only_number_is_rejected(self, run_in_background):
+        for submit in (self.submit_contact, self.submit_quick_contact):
+            for phone in ('555-1234', '212-5550'):
+                with self.subTest(submit=submit.__name__, phone=phone):
+                    response = submit(phone)
+                    
+                    self.assertEqual(response.status_code, 400)
+                    self.assertIn('phone', response.json()['errors'])
+        self.assertFalse(ContactInquiry.objects.exists())
+    
+    def test_formatted_us_number_is_stored_in_e164(self, run_in_background):
+        for submit in (self.submit_contact, self.submit_quick_contact):
+            with self.subTest(submit=submit.__name__):
+                response = submit('(212) 555-0123')
+                
+                self.assertEqual(response.status_code, 200)
+                inquiry = ContactInquiry.objects.latest('id')
+                self.assertEqual(inquiry.phone, '+12125550123')
+    
+    def test_international_number_is_stored_in_e164(self, run_in_background):
+        for submit in (self.submit_contact, self.submit_quick_contact):
+            with self.subTest(submit=submit.__name__):
+                response = submit('+44 20 7946 0958')
+                
+                self.assertEqual(response.status_code, 200)
+                inquiry = ContactInquiry.objects.latest('id')
+                self.assertEqual(inquiry.phone, '+442079460958')
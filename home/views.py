@@ -1,47 +1,49 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponse
 from django.contrib import messages
-from django.core.mail import send_mail, EmailMessage
+from django.core.mail import send_mail, EmailMessage, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
-from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from django.db import IntegrityError, transaction
 from django.db.models import Q, Count
+from functools import lru_cache
+import ipaddress
 import json
 import logging
+import orjson
 
 from .models import (
-    ContactInquiry, NewsletterSubscription, ContactMethod, 
-    FAQ, Testimonial, Service, ContactLog
+    ContactInquiry, NewsletterSubscription, ContactLog, ServiceTag
 )
+from . import caching
+from .tasks import run_in_background
 from .forms import (
-    ContactInquiryForm, NewsletterSubscriptionForm, QuickContactForm
+    ContactInquiryAPIForm, NewsletterSubscriptionForm, QuickContactForm
 )
 
 logger = logging.getLogger(__name__)
 
+class ORJsonResponse(HttpResponse):
+    """JSON response serialized with orjson"""
+    
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=orjson.dumps(data), **kwargs)
+
 def home(request):
     """Home page view"""
-    # Get featured testimonials
-    featured_testimonials = Testimonial.objects.filter(
-        is_active=True, 
-        is_featured=True
-    )[:2]
-    
-    # Get active services
-    services = Service.objects.filter(is_active=True).order_by('order')
+    # Get featured testimonials and active services
+    home_static = caching.home_static()
     
     # Get some statistics
-    stats = {
-        'total_doctors': ContactInquiry.objects.filter(status__in=['closed', 'negotiating']).count(),
-        'total_inquiries': ContactInquiry.objects.count(),
-        'active_subscriptions': NewsletterSubscription.objects.filter(is_active=True).count(),
-    }
+    stats = caching.home_stats()
     
     context = {
-        'featured_testimonials': featured_testimonials,
-        'services': services,
+        'featured_testimonials': home_static['featured_testimonials'],
+        'services': home_static['services'],
         'stats': stats,
     }
     return render(request, 'home.html', context)
@@ -49,11 +51,7 @@ def home(request):
 def about(request):
     """About page view"""
     # Get team statistics
-    stats = {
-        'years_experience': 5,
-        'doctors_served': ContactInquiry.objects.filter(status__in=['closed', 'negotiating']).count(),
-        'medical_specialties': ContactInquiry.objects.values('specialty').distinct().count(),
-    }
+    stats = caching.about_stats()
     
     context = {
         'stats': stats,
@@ -63,10 +61,10 @@ def about(request):
 def contact(request):
     """Contact page view"""
     # Get contact methods
-    contact_methods = ContactMethod.objects.filter(is_active=True).order_by('order')
+    contact_methods = caching.active_contact_methods()
     
     # Get active FAQs
-    faqs = FAQ.objects.filter(is_active=True).order_by('category', 'order')
+    faqs = caching.active_faqs()
     
     # Get office location info
     office_info = {
@@ -84,227 +82,244 @@ def contact(request):
     }
     return render(request, 'contact.html', context)
 
+def save_contact_inquiry(form, ip_address, user_agent):
+    """Save a validated contact submission and queue its emails"""
+    # Create the contact inquiry
+    inquiry_data = dict(form.cleaned_data)
+    services = inquiry_data.pop('services_checkboxes')
+    inquiry = ContactInquiry(**inquiry_data)
+    inquiry.ip_address = ip_address
+    inquiry.user_agent = user_agent
+    
+    with transaction.atomic():
+        # Save the inquiry
+        inquiry.save()
+        
+        # Handle services selection
+        inquiry.services_needed.set(ServiceTag.objects.filter(slug__in=services))
+        
+        # Handle newsletter subscription if requested
+        if form.cleaned_data.get('newsletter_subscription'):
+            NewsletterSubscription.objects.get_or_create(
+                email=inquiry.email,
+                defaults={
+                    'first_name': inquiry.first_name,
+                    'last_name': inquiry.last_name,
+                    'source': 'contact-form'
+                }
+            )
+        
+        # Log the contact
+        ContactLog.objects.create(
+            inquiry=inquiry,
+            action='form_submitted',
+            description=f'Contact form submitted via website',
+            performed_by='System'
+        )
+    
+    # Send confirmation email to the doctor and notify the team
+    run_in_background(send_inquiry_emails, inquiry)
+    
+    return inquiry
+
 @require_http_methods(["POST"])
-def submit_contact_inquiry(request):
+async def submit_contact_inquiry(request):
     """Handle contact form submission"""
-    if request.method == 'POST':
-        form = ContactInquiryForm(request.POST)
-        
-        if form.is_valid():
-            try:
-                # Create the contact inquiry
-                inquiry = form.save(commit=False)
-                
-                # Get client IP and user agent
-                inquiry.ip_address = get_client_ip(request)
-                inquiry.user_agent = request.META.get('HTTP_USER_AGENT', '')
-                
-                # Handle services selection
-                services = form.cleaned_data.get('services_checkboxes', [])
-                inquiry.services_needed = services
-                
-                # Save the inquiry
-                inquiry.save()
-                
-                # Handle newsletter subscription if requested
-                if form.cleaned_data.get('newsletter_subscription'):
-                    NewsletterSubscription.objects.get_or_create(
-                        email=inquiry.email,
-                        defaults={
-                            'first_name': inquiry.first_name,
-                            'last_name': inquiry.last_name,
-                            'source': 'contact-form'
-                        }
-                    )
-                
-                # Send confirmation email to the doctor
-                send_doctor_confirmation_email(inquiry)
-                
-                # Send notification email to the team
-                send_team_notification_email(inquiry)
-                
-                # Log the contact
-                ContactLog.objects.create(
-                    inquiry=inquiry,
-                    action='form_submitted',
-                    description=f'Contact form submitted via website',
-                    performed_by='System',
-                    performed_at=timezone.now()
-                )
-                
-                # Return success response
-                return JsonResponse({
-                    'success': True,
-                    'message': 'Thank you! Your inquiry has been submitted successfully. We\'ll get back to you within 2 hours.',
-                    'inquiry_id': inquiry.id
-                })
-                
-            except Exception as e:
-                logger.error(f"Error saving contact inquiry: {str(e)}")
-                return JsonResponse({
-                    'success': False,
-                    'message': 'Sorry, there was an error submitting your inquiry. Please try again or contact us directly.'
-                }, status=500)
-        else:
-            # Return form errors
-            errors = {}
-            for field, field_errors in form.errors.items():
-                errors[field] = [str(error) for error in field_errors]
+    form = ContactInquiryAPIForm(request.POST)
+    
+    if form.is_valid():
+        try:
+            # Get client IP and user agent
+            ip_address = get_client_ip(request)
+            user_agent = request.META.get('HTTP_USER_AGENT', '')
+            
+            # Database writes run in a worker thread so the event loop stays free
+            inquiry = await sync_to_async(save_contact_inquiry)(form, ip_address, user_agent)
+            
+            # Return success response
+            return ORJsonResponse({
+                'success': True,
+                'message': 'Thank you! Your inquiry has been submitted successfully. We\'ll get back to you within 2 hours.',
+                'inquiry_id': inquiry.id
+            })
             
-            return JsonResponse({
+        except Exception as e:
+            logger.error(f"Error saving contact inquiry: {str(e)}")
+            return ORJsonResponse({
                 'success': False,
-                'message': 'Please correct the errors below.',
-                'errors': errors
-            }, status=400)
-    
-    return JsonResponse({
-        'success': False,
-        'message': 'Invalid request method.'
-    }, status=405)
+                'message': 'Sorry, there was an error submitting your inquiry. Please try again or contact us directly.'
+            }, status=500)
+    else:
+        # Return form errors
+        errors = {}
+        for field, field_errors in form.errors.items():
+            errors[field] = [str(error) for error in field_errors]
+        
+        return ORJsonResponse({
+            'success': False,
+            'message': 'Please correct the errors below.',
+            'errors': errors
+        }, status=400)
 
 @require_http_methods(["POST"])
 def subscribe_newsletter(request):
     """Handle newsletter subscription"""
-    if request.method == 'POST':
-        form = NewsletterSubscriptionForm(request.POST)
-        
-        if form.is_valid():
-            try:
-                # Check if already subscribed
-                email = form.cleaned_data['email']
-                subscription, created = NewsletterSubscription.objects.get_or_create(
+    form = NewsletterSubscriptionForm(request.POST)
+    
+    if form.is_valid():
+        try:
+            email = form.cleaned_data['email']
+            first_name = form.cleaned_data.get('first_name', '')
+            last_name = form.cleaned_data.get('last_name', '')
+            
+            # Reactivate an inactive subscription in a single UPDATE
+            reactivated = NewsletterSubscription.objects.filter(
+                email=email, is_active=False
+            ).update(is_active=True, first_name=first_name, last_name=last_name)
+            
+            if reactivated:
+                subscription = NewsletterSubscription.objects.get(email=email)
+            else:
+                subscription = NewsletterSubscription(
                     email=email,
-                    defaults={
-                        'first_name': form.cleaned_data.get('first_name', ''),
-                        'last_name': form.cleaned_data.get('last_name', ''),
-                        'source': 'website'
-                    }
+                    first_name=first_name,
+                    last_name=last_name,
+                    source='website'
                 )
-                
-                if not created and subscription.is_active:
-                    return JsonResponse({
+                try:
+                    with transaction.atomic():
+                        subscription.save()
+                except IntegrityError:
+                    # The unique email index says an active subscription exists
+                    return ORJsonResponse({
                         'success': False,
                         'message': 'You are already subscribed to our newsletter.'
                     }, status=400)
-                
-                # Activate subscription if it was inactive
-                if not subscription.is_active:
-                    subscription.is_active = True
-                    subscription.save()
-                
-                # Send welcome email
-                send_newsletter_welcome_email(subscription)
-                
-                return JsonResponse({
-                    'success': True,
-                    'message': 'Thank you for subscribing to our newsletter!'
-                })
-                
-            except Exception as e:
-                logger.error(f"Error subscribing to newsletter: {str(e)}")
-                return JsonResponse({
-                    'success': False,
-                    'message': 'Sorry, there was an error subscribing you to our newsletter. Please try again.'
-                }, status=500)
-        else:
-            errors = {}
-            for field, field_errors in form.errors.items():
-                errors[field] = [str(error) for error in field_errors]
             
-            return JsonResponse({
+            # Send welcome email
+            run_in_background(send_newsletter_welcome_email, subscription)
+            
+            return ORJsonResponse({
+                'success': True,
+                'message': 'Thank you for subscribing to our newsletter!'
+            })
+            
+        except Exception as e:
+            logger.error(f"Error subscribing to newsletter: {str(e)}")
+            return ORJsonResponse({
                 'success': False,
-                'message': 'Please correct the errors below.',
-                'errors': errors
-            }, status=400)
-    
-    return JsonResponse({
-        'success': False,
-        'message': 'Invalid request method.'
-    }, status=405)
+                'message': 'Sorry, there was an error subscribing you to our newsletter. Please try again.'
+            }, status=500)
+    else:
+        errors = {}
+        for field, field_errors in form.errors.items():
+            errors[field] = [str(error) for error in field_errors]
+        
+        return ORJsonResponse({
+            'success': False,
+            'message': 'Please correct the errors below.',
+            'errors': errors
+        }, status=400)
 
 @require_http_methods(["POST"])
 def quick_contact(request):
     """Handle quick contact form"""
-    if request.method == 'POST':
-        form = QuickContactForm(request.POST)
-        
-        if form.is_valid():
-            try:
-                # Create a basic contact inquiry
-                inquiry = ContactInquiry.objects.create(
-                    first_name=form.cleaned_data['name'].split()[0] if form.cleaned_data['name'] else '',
-                    last_name=' '.join(form.cleaned_data['name'].split()[1:]) if len(form.cleaned_data['name'].split()) > 1 else '',
-                    email=form.cleaned_data['email'],
-                    phone=form.cleaned_data.get('phone', ''),
-                    practice_name='Quick Contact',
-                    specialty='other',
-                    location='Not specified',
-                    message=form.cleaned_data['message'],
-                    status='new',
-                    priority='medium',
-                    ip_address=get_client_ip(request),
-                    user_agent=request.META.get('HTTP_USER_AGENT', ''),
-                    notes=f"Quick contact form. Preferred contact method: {form.cleaned_data['contact_preference']}"
-                )
-                
-                # Send notification email to team
-                send_quick_contact_notification(inquiry, form.cleaned_data['contact_preference'])
-                
-                return JsonResponse({
-                    'success': True,
-                    'message': 'Thank you for your message! We\'ll get back to you soon.'
-                })
-                
-            except Exception as e:
-                logger.error(f"Error processing quick contact: {str(e)}")
-                return JsonResponse({
-                    'success': False,
-                    'message': 'Sorry, there was an error sending your message. Please try again.'
-                }, status=500)
-        else:
-            errors = {}
-            for field, field_errors in form.errors.items():
-                errors[field] = [str(error) for error in field_errors]
+    form = QuickContactForm(request.POST)
+    
+    if form.is_valid():
+        try:
+            # Split the name into first and last parts
+            name_parts = (form.cleaned_data['name'] or '').split(None, 1)
+            first_name = name_parts[0] if name_parts else ''
+            last_name = name_parts[1] if len(name_parts) > 1 else ''
+            
+            # Create a basic contact inquiry
+            inquiry = ContactInquiry.objects.create(
+                first_name=first_name,
+                last_name=last_name,
+                email=form.cleaned_data['email'],
+                phone=form.cleaned_data.get('phone', ''),
+                practice_name='Quick Contact',
+                specialty='other',
+                location='Not specified',
+                message=form.cleaned_data['message'],
+                status='new',
+                priority='medium',
+                ip_address=get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', ''),
+                notes=f"Quick contact form. Preferred contact method: {form.cleaned_data['contact_preference']}"
+            )
+            
+            # Send notification email to team
+            run_in_background(send_quick_contact_notification, inquiry, form.cleaned_data['contact_preference'])
             
-            return JsonResponse({
+            return ORJsonResponse({
+                'success': True,
+                'message': 'Thank you for your message! We\'ll get back to you soon.'
+            })
+            
+        except Exception as e:
+            logger.error(f"Error processing quick contact: {str(e)}")
+            return ORJsonResponse({
                 'success': False,
-                'message': 'Please correct the errors below.',
-                'errors': errors
-            }, status=400)
-    
-    return JsonResponse({
-        'success': False,
-        'message': 'Invalid request method.'
-    }, status=405)
+                'message': 'Sorry, there was an error sending your message. Please try again.'
+            }, status=500)
+    else:
+        errors = {}
+        for field, field_errors in form.errors.items():
+            errors[field] = [str(error) for error in field_errors]
+        
+        return ORJsonResponse({
+            'success': False,
+            'message': 'Please correct the errors below.',
+            'errors': errors
+        }, status=400)
+
+@lru_cache(maxsize=1024)
+def _is_valid_ip(value):
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
 
 def get_client_ip(request):
     """Get client IP address"""
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+        ip = x_forwarded_for.partition(',')[0].strip()
+        if _is_valid_ip(ip):
+            return ip
+    return request.META.get('REMOTE_ADDR')
+
+def send_inquiry_emails(inquiry):
+    """Send the doctor confirmation and team notification over one SMTP connection"""
+    try:
+        with get_connection() as connection:
+            send_doctor_confirmation_email(inquiry, connection=connection)
+            send_team_notification_email(inquiry, connection=connection)
+    except Exception as e:
+        logger.error(f"Error opening email connection: {str(e)}")
 
-def send_doctor_confirmation_email(inquiry):
+def send_doctor_confirmation_email(inquiry, connection=None):
     """Send confirmation email to the doctor"""
     try:
         subject = f"Thank you for your inquiry, Dr. {inquiry.last_name}!"
         
         context = {
             'inquiry': inquiry,
-            'services': inquiry.services_needed,
+            'services': inquiry.services_needed.all(),
         }
         
         html_message = render_to_string('emails/doctor_confirmation.html', context)
-        plain_message = render_to_string('emails/doctor_confirmation.txt', context)
         
         email = EmailMessage(
             subject=subject,
             body=html_message,
             from_email=settings.DEFAULT_FROM_EMAIL,
             to=[inquiry.email],
-            reply_to=[settings.DEFAULT_FROM_EMAIL]
+            reply_to=[settings.DEFAULT_FROM_EMAIL],
+            connection=connection
         )
         email.content_subtype = "html"
         email.send()
@@ -314,18 +329,17 @@ def send_doctor_confirmation_email(inquiry):
     except Exception as e:
         logger.error(f"Error sending confirmation email: {str(e)}")
 
-def send_team_notification_email(inquiry):
+def send_team_notification_email(inquiry, connection=None):
     """Send notification email to the team"""
     try:
         subject = f"New Contact Inquiry: {inquiry.practice_name}"
         
         context = {
             'inquiry': inquiry,
-            'services': inquiry.services_needed,
+            'services': inquiry.services_needed.all(),
         }
         
         html_message = render_to_string('emails/team_notification.html', context)
-        plain_message = render_to_string('emails/team_notification.txt', context)
         
         # Send to team email (you can configure this in settings)
         team_email = getattr(settings, 'TEAM_EMAIL', settings.DEFAULT_FROM_EMAIL)
@@ -335,7 +349,8 @@ def send_team_notification_email(inquiry):
             body=html_message,
             from_email=settings.DEFAULT_FROM_EMAIL,
             to=[team_email],
-            reply_to=[inquiry.email]
+            reply_to=[inquiry.email],
+            connection=connection
         )
         email.content_subtype = "html"
         email.send()
@@ -355,7 +370,6 @@ def send_newsletter_welcome_email(subscription):
         }
         
         html_message = render_to_string('emails/newsletter_welcome.html', context)
-        plain_message = render_to_string('emails/newsletter_welcome.txt', context)
         
         email = EmailMessage(
             subject=subject,
@@ -382,7 +396,6 @@ def send_quick_contact_notification(inquiry, contact_preference):
         }
         
         html_message = render_to_string('emails/quick_contact_notification.html', context)
-        plain_message = render_to_string('emails/quick_contact_notification.txt', context)
         
         team_email = getattr(settings, 'TEAM_EMAIL', settings.DEFAULT_FROM_EMAIL)
         
@@ -403,25 +416,25 @@ def send_quick_contact_notification(inquiry, contact_preference):
 
 # API endpoints for AJAX requests
 @csrf_exempt
-def contact_api(request):
+async def contact_api(request):
     """API endpoint for contact form submissions"""
     if request.method == 'POST':
-        return submit_contact_inquiry(request)
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+        return await submit_contact_inquiry(request)
+    return ORJsonResponse({'error': 'Method not allowed'}, status=405)
 
 @csrf_exempt
 def newsletter_api(request):
     """API endpoint for newsletter subscriptions"""
     if request.method == 'POST':
         return subscribe_newsletter(request)
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+    return ORJsonResponse({'error': 'Method not allowed'}, status=405)
 
 @csrf_exempt
 def quick_contact_api(request):
     """API endpoint for quick contact form"""
     if request.method == 'POST':
         return quick_contact(request)
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+    return ORJsonResponse({'error': 'Method not allowed'}, status=405)
 
 # Dashboard views for managing inquiries
 def dashboard(request):
@@ -430,19 +443,22 @@ def dashboard(request):
         return redirect('home')
     
     # Get recent inquiries
-    recent_inquiries = ContactInquiry.objects.all().order_by('-submitted_at')[:10]
+    recent_inquiries = ContactInquiry.objects.only(
+        'first_name', 'last_name', 'full_name', 'email', 'practice_name',
+        'specialty', 'status', 'submitted_at'
+    ).order_by('-submitted_at')[:10]
     
     # Get statistics
-    stats = {
-        'total_inquiries': ContactInquiry.objects.count(),
-        'new_inquiries': ContactInquiry.objects.filter(status='new').count(),
-        'contacted_inquiries': ContactInquiry.objects.filter(status='contacted').count(),
-        'qualified_inquiries': ContactInquiry.objects.filter(status='qualified').count(),
-        'closed_inquiries': ContactInquiry.objects.filter(status='closed').count(),
-    }
+    stats = ContactInquiry.objects.aggregate(
+        total_inquiries=Count('id'),
+        new_inquiries=Count('id', filter=Q(status='new')),
+        contacted_inquiries=Count('id', filter=Q(status='contacted')),
+        qualified_inquiries=Count('id', filter=Q(status='qualified')),
+        closed_inquiries=Count('id', filter=Q(status='closed')),
+    )
     
     # Get inquiries by specialty
-    specialty_stats = ContactInquiry.objects.values('specialty').annotate(
+    specialty_stats = ContactInquiry.objects.values_list('specialty').annotate(
         count=Count('id')
     ).order_by('-count')[:5]
     
@@ -460,7 +476,9 @@ def inquiry_detail(request, inquiry_id):
         return redirect('home')
     
     inquiry = get_object_or_404(ContactInquiry, id=inquiry_id)
-    contact_logs = inquiry.contact_logs.all().order_by('-performed_at')
+    contact_logs = inquiry.contact_logs.only(
+        'inquiry', 'action', 'description', 'performed_by', 'performed_at'
+    ).order_by('-performed_at')
     
     context = {
         'inquiry': inquiry,